@@ -4,11 +4,11 @@ Objects representing the cypher nodes and edges.
 from typing import (
     Any,
     Callable,
+    Dict,
     Iterable,
     Mapping,
     MutableMapping,
     MutableSet,
-    List,
     Optional,
     Tuple,
     Type,
@@ -32,16 +32,42 @@ class Model:
         abstract: bool = True
         database: str = 'default'
 
+    # Props of the model sorted by name, collected by `__init_subclass__`.
+    _model_props: Dict[str, BaseProp] = {}
+    # Names of the props above keyed by `id` of the prop.
+    _prop_names: Dict[int, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """
+        Collect props of the new model type, including inherited ones.
+        """
+        super().__init_subclass__(**kwargs)
+
+        model_props = {}
+        for base in reversed(cls.__mro__):
+            for name, value in vars(base).items():
+                if isinstance(value, BaseProp):
+                    model_props[name] = value
+                elif name in model_props:
+                    del model_props[name]
+
+        cls._model_props = {
+            name: model_props[name]
+            for name in sorted(model_props)
+        }
+
+        # Props are not hashable, hence the names are keyed by identity. A
+        # prop declared under several names is known by the first one.
+        cls._prop_names = {}
+        for name, prop in cls._model_props.items():
+            cls._prop_names.setdefault(id(prop), name)
+
     def __init__(self, **kwargs):
         self._labels: MutableSet[str] = {self.__class__.__name__}
         self._props: MutableMapping[str, Any] = {}
 
         cls = type(self)
-        model_props = {
-            prop: getattr(self, prop)
-            for prop in dir(cls)
-            if isinstance(getattr(self, prop), BaseProp)
-        }
+        model_props = cls.get_model_props()
 
         for name, prop in model_props.items():
             value = kwargs.get(name, prop.default)
@@ -65,6 +91,27 @@ class Model:
             if prop not in model_props
         }
 
+    @classmethod
+    def get_model_props(cls) -> Mapping[str, BaseProp]:
+        """
+        Props are collected once, when the model type is created, so they
+        have to be declared in the class body.
+
+        :return: props of the model sorted by name
+        """
+        return cls._model_props
+
+    @classmethod
+    def get_prop_name(cls, prop: BaseProp) -> str:
+        """
+        :return: name under which the prop is declared on the model
+        """
+        try:
+            return cls._prop_names[id(prop)]
+        except KeyError:
+            error_text = f'`{prop}` is not a prop of `{cls.__name__}`'
+            raise ValueError(error_text) from None
+
     @property
     def labels(self) -> MutableSet[str]:
         """
@@ -117,7 +164,14 @@ class ModelDetails:
     """
     Organized details of a pattern unit.
     """
-    __slots__ = ['var', 'type', 'instance', 'conn']
+    __slots__ = [
+        'var',
+        'type',
+        'instance',
+        'conn',
+        '_labels',
+        '_var_and_labels',
+    ]
 
     def __init__(
             self,
@@ -130,28 +184,48 @@ class ModelDetails:
         if isinstance(identifier, (Node, Edge)):
             self.type = type(identifier)
             self.instance = identifier
-        elif issubclass(identifier, (Node, Edge)):
+        elif (
+                isinstance(identifier, type)
+                and issubclass(identifier, (Node, Edge))
+        ):
             self.type = identifier
             self.instance = None
         else:
-            raise TypeError
+            error_text = f'`{identifier}` is neither a Node nor an Edge'
+            raise TypeError(error_text)
         # self.start: Optional[str] = None
         # self.end: Optional[str] = None
         self.conn = conn
+        self._labels: Optional[Tuple[str, ...]] = None
+        self._var_and_labels: Optional[str] = None
 
-    def get_labels(self) -> List[str]:
+    def get_labels(self) -> Tuple[str, ...]:
         """
+        Labels of a model type are computed on the first call and reused
+        afterwards. Labels of an instance can change, so they are not cached.
+
         :return: sorted tuple of labels
         """
         if self.instance:
-            return sorted(self.instance.labels)
-        elif self.type is Edge or self.type is Node:
-            return []
-        return [self.type.__name__]
+            return tuple(sorted(self.instance.labels))
+
+        if self._labels is None:
+            if self.type is Edge or self.type is Node:
+                self._labels = ()
+            else:
+                self._labels = (self.type.__name__,)
+
+        return self._labels
 
     def get_var_and_labels(self) -> str:
         """
         Get a string ready to be used in cypher pattern.
         Example: `a:Human:Person`.
         """
-        return ':'.join((self.var, *self.get_labels()))
+        if self.instance:
+            return ':'.join((self.var, *self.get_labels()))
+
+        if self._var_and_labels is None:
+            self._var_and_labels = ':'.join((self.var, *self.get_labels()))
+
+        return self._var_and_labels
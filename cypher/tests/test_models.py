@@ -7,6 +7,21 @@ from ..props import Props
 from ..models import Model
 
 
+class SomeModel(Model):
+    """
+    Synthetic model type without props.
+    """
+
+
+class TypedModel(Model):
+    """
+    Synthetic model type with props.
+    """
+    boolean = Props.Boolean(required=False)
+    string = Props.String()
+    partial = Props.Float(default=2)
+
+
 class ModelTests(TestCase):
     """
     Test common functionality of Node and Edge.
@@ -15,39 +30,90 @@ class ModelTests(TestCase):
         """
         Test the model instantiation.
         """
-        class SomeModel(Model):
+        self.assertRaises(ValueError, TypedModel)
+
+        instance = TypedModel(string='string')
+        self.assertIsNone(instance.boolean)
+        self.assertEqual(instance.string, 'string')
+        self.assertEqual(instance.partial, 2.)
+
+        self.assertRaises(TypeError, TypedModel, string=2)
+
+        instance = TypedModel(boolean=False, string='string', partial=3)
+        self.assertIs(instance.boolean, False)
+        self.assertEqual(instance.string, 'string')
+        self.assertEqual(instance.partial, 3.)
+
+    def test_get_model_props(self):
+        """
+        Model props are collected once and sorted by name.
+        """
+        class BaseModel(Model):
             """
             Synthetic model type.
             """
-            boolean = Props.Boolean(required=False)
             string = Props.String()
-            partial = Props.Float(default=2)
+            boolean = Props.Boolean()
 
-        with self.assertRaises(ValueError):
-            SomeModel()
+        class OtherModel(BaseModel):
+            """
+            Synthetic model type inheriting props.
+            """
+            boolean = None
+            age = Props.Integer()
 
-        instance = SomeModel(string='string')
-        self.assertEqual(instance.boolean, None)
-        self.assertEqual(instance.string, 'string')
-        self.assertEqual(instance.partial, 2.)
+        model_props = BaseModel.get_model_props()
+        self.assertEqual(list(model_props), ['boolean', 'string'])
+        self.assertIs(model_props['string'], BaseModel.string)
+        self.assertIs(BaseModel.get_model_props(), model_props)
 
-        with self.assertRaises(TypeError):
-            SomeModel(string=2)
+        model_props = OtherModel.get_model_props()
+        self.assertEqual(list(model_props), ['age', 'string'])
+        self.assertEqual(Model.get_model_props(), {})
 
-        instance = SomeModel(boolean=False, string='string', partial=3)
-        self.assertEqual(instance.boolean, False)
-        self.assertEqual(instance.string, 'string')
-        self.assertEqual(instance.partial, 3.)
+    def test_get_prop_name(self):
+        """
+        Props are named after the attribute of the model they are found in.
+        """
+        class OtherModel(Model):
+            """
+            Synthetic model type reusing a prop under another name.
+            """
+            alias = TypedModel.string
 
-    def test_labels(self):
+        self.assertEqual(
+            TypedModel.get_prop_name(TypedModel.string),
+            'string',
+        )
+        self.assertEqual(OtherModel.get_prop_name(TypedModel.string), 'alias')
+        self.assertRaises(
+            ValueError,
+            OtherModel.get_prop_name,
+            TypedModel.boolean,
+        )
+
+    def test_late_props(self):
         """
-        Test labels setter and getter.
+        Props assigned after the model type is created are not collected.
         """
-        class SomeModel(Model):
+        class OtherModel(Model):
             """
             Synthetic model type.
             """
 
+        OtherModel.nick = Props.String()
+        self.assertEqual(OtherModel.get_model_props(), {})
+        self.assertRaises(
+            ValueError,
+            OtherModel.get_prop_name,
+            OtherModel.nick,
+        )
+        self.assertEqual(OtherModel(nick=3).props, {'nick': 3})
+
+    def test_labels(self):
+        """
+        Test labels setter and getter.
+        """
         instance = SomeModel()
         self.assertEqual(instance.labels, {'SomeModel'})
 
@@ -64,11 +130,6 @@ class ModelTests(TestCase):
         """
         Test props setter and getter.
         """
-        class SomeModel(Model):
-            """
-            Synthetic model type.
-            """
-
         instance = SomeModel(name='John', age=34)
         with self.assertRaises(AttributeError):
             getattr(instance, 'name')
@@ -2,11 +2,100 @@
 Tests for `query.py`.
 """
 # from datetime import date
+from itertools import islice
 from unittest import TestCase
 
 from ..props import Props
 from ..models import Edge, Node
-from ..query import Query
+from ..query import Query, generate_variables
+from ..values import String
+
+
+class Human(Node):
+    """
+    Example of Node.
+    """
+    class Meta(Node.Meta):
+        """
+        Example of Node.Meta.
+        """
+        primary_key = 'name'
+
+    name = Props.String()
+    admin = Props.Boolean(required=False)
+    age = Props.Integer(required=False)
+
+
+class Animal(Node):
+    """
+    Example of Node.
+    """
+
+
+class User(Node):
+    """
+    Example of Node.
+    """
+
+
+class Knows(Edge):
+    """
+    Example of Edge.
+    """
+    class Meta(Edge.Meta):
+        """
+        Example of Edge.Meta.
+        """
+        primary_key = 'reason'
+
+    reason = Props.String(required=False)
+
+
+class GeneratorTests(TestCase):
+    """
+    Test variable generators.
+    """
+    def test_generate_variables(self):
+        """
+        Variables grow in length after "_z" and never start with "_p".
+        """
+        variables = list(islice(generate_variables(), 700))
+
+        self.assertEqual(variables[:3], ['_a', '_b', '_c'])
+        self.assertEqual(variables[14:16], ['_o', '_q'])
+        self.assertEqual(variables[24:27], ['_z', '_aa', '_ab'])
+        self.assertNotIn('_p', variables)
+        self.assertFalse(any(var.startswith('_p') for var in variables))
+        self.assertEqual(len(variables), len(set(variables)))
+
+    def test_query_variables(self):
+        """
+        Query continues with the generator after precomputed variables.
+        """
+        query = Query()
+        for _ in range(677):
+            query.match(None)
+
+        variables = list(query.output)
+        self.assertEqual(variables[23:27], ['_y', '_z', '_aa', '_ab'])
+        self.assertEqual(variables[673:], ['_zy', '_zz', '_aaa', '_aab'])
+
+    def test_query_paths(self):
+        """
+        Query continues with the generator after precomputed paths.
+        """
+        query = Query().match(None)
+        for _ in range(101):
+            query.connected_through(None).with_(None)
+
+        paths = [
+            line.split(' = ')[0][len('MATCH '):]
+            for line in query.result(no_exec=True).splitlines()
+            if line.startswith('MATCH ')
+        ]
+        self.assertEqual(len(paths), 101)
+        self.assertEqual(paths[:2], ['_p1', '_p2'])
+        self.assertEqual(paths[97:], ['_p98', '_p99', '_p100', '_p101'])
 
 
 class MatchTests(TestCase):
@@ -28,11 +117,6 @@ class MatchTests(TestCase):
         """
         The most simple `match` scenario by class.
         """
-        class Human(Node):
-            """
-            Example of Node.
-            """
-
         query = Query().match(Human).result(no_exec=True)
         expected = (
             'MATCH (_a:Human)\n'
@@ -44,31 +128,19 @@ class MatchTests(TestCase):
         """
         Pass wrong type to match.
         """
-        class Human:
+        class NotNode:
             """
             Example of not Node.
             """
 
         with self.assertRaises(TypeError):
             # noinspection PyTypeChecker
-            Query().match(Human)
+            Query().match(NotNode)
 
     def test_match_by_instance(self):
         """
         Match by instance.
         """
-        class Human(Node):
-            """
-            Example of Node.
-            """
-            class Meta(Node.Meta):
-                """
-                Example of Node.Meta.
-                """
-                primary_key = 'name'
-
-            name = Props.String()
-
         human = Human(name='John')
 
         query = Query().match(human).result(no_exec=True)
@@ -79,20 +151,26 @@ class MatchTests(TestCase):
         )
         self.assertEqual(query, expected)
 
-    def test_combined_match_by_class(self):
+    def test_changed_instance_labels(self):
         """
-        Combination of 2 most simple `match` scenarios.
+        Labels of a matched instance are read whenever the query is rendered.
         """
-        class Human(Node):
-            """
-            Example of Node.
-            """
+        human = Human(name='John')
+        query = Query().match(human)
+        query.result(no_exec=True)
 
-        class Animal(Node):
-            """
-            Example of Node.
-            """
+        human.labels = ('Admin',)
+        expected = (
+            'MATCH (_a:Admin:Human)\n'
+            'WHERE _a.name = "John"\n'
+            'RETURN _a'
+        )
+        self.assertEqual(query.result(no_exec=True), expected)
 
+    def test_combined_match_by_class(self):
+        """
+        Combination of 2 most simple `match` scenarios.
+        """
         query = Query().match(Human).match(Animal).result(no_exec=True)
         expected = (
             'MATCH (_a:Human)\n'
@@ -108,23 +186,6 @@ class MatchTests(TestCase):
         # pylint: disable=invalid-name
         # This suppresses error for the method name.
         # pylint: enable=no-member
-        class Human(Node):
-            """
-            Example of Node.
-            """
-            class Meta(Node.Meta):
-                """
-                Example of Node.Meta.
-                """
-                primary_key = 'name'
-
-            name = Props.String()
-
-        class Animal(Node):
-            """
-            Example of Node.
-            """
-
         human = Human(name='human_name')
         query = Query()\
             .match(human)\
@@ -145,12 +206,6 @@ class MatchTests(TestCase):
         # pylint: disable=invalid-name
         # This suppresses error for the method name.
         # pylint: enable=no-member
-        class Human(Node):
-            """
-            Example of Node.
-            """
-            admin = Props.Boolean()
-            age = Props.Integer()
 
         # pylint: disable=singleton-comparison
         query = Query()\
@@ -185,16 +240,6 @@ class MatchTests(TestCase):
         """
         Match a path with front or back direction.
         """
-        class Human(Node):
-            """
-            Example of Node.
-            """
-
-        class Knows(Edge):
-            """
-            Example of Edge.
-            """
-
         query = Query()\
             .match(None)\
             .connected_through(Knows)\
@@ -231,18 +276,6 @@ class MatchTests(TestCase):
         """
         Match a path with edge instance instead of Edge type.
         """
-        class Knows(Edge):
-            """
-            Example of Edge.
-            """
-            class Meta(Edge.Meta):
-                """
-                Example of Edge.Meta.
-                """
-                primary_key = 'reason'
-
-            reason = Props.String()
-
         instance = Knows(reason='some reason')
         query = Query()\
             .match(None)\
@@ -264,16 +297,6 @@ class MatchTests(TestCase):
         # pylint: disable=invalid-name
         # This suppresses error for the method name.
         # pylint: enable=no-member
-        class User(Node):
-            """
-            Example of Node.
-            """
-
-        class Knows(Edge):
-            """
-            Example of edge.
-            """
-
         query = Query()\
             .match(User)\
             .connected_through(Knows, conn=(None, None))\
@@ -303,11 +326,6 @@ class MatchTests(TestCase):
         """
         Test a cyclic path user-[a]->b-[c]->user-[d]-user<-[e]-user.
         """
-        class User(Node):
-            """
-            Example of Node.
-            """
-
         query = Query()\
             .match(User, 'user')\
             .connected_through(None)\
@@ -329,6 +347,75 @@ class MatchTests(TestCase):
         )
 
         self.assertEqual(query, expected)
+
+    def test_repeated_result(self):
+        """
+        Calling `result` again should render the same query.
+        """
+        query = Query()\
+            .match(Human)\
+            .connected_through(None)\
+            .to(Human)
+        expected = (
+            'MATCH _p1 = (_a:Human)-[_b]->(_c:Human)\n'
+            'RETURN _a, _b, _c'
+        )
+
+        self.assertEqual(query.result(no_exec=True), expected)
+        self.assertEqual(query.result(no_exec=True), expected)
+
+        query.where(Human.age > 21).match(Animal)
+        expected = (
+            'MATCH _p1 = (_a:Human)-[_b]->(_c:Human)\n'
+            'WHERE _c.age > 21\n'
+            'MATCH (_d:Animal)\n'
+            'RETURN _a, _b, _c, _d'
+        )
+        self.assertEqual(query.result(no_exec=True), expected)
+
+    def test_condition_is_rendered_once(self):
+        """
+        Changing a value after adding a condition should not change the query.
+        """
+        name = String('_a.name')
+        query = Query().match(Human).where(name == 'x')
+        name.lower()
+        expected = (
+            'MATCH (_a:Human)\n'
+            'WHERE _a.name = "x"\n'
+            'RETURN _a'
+        )
+        self.assertEqual(query.result(no_exec=True), expected)
+
+    def test_duplicate_chains(self):
+        """
+        Identical chains should be rendered only once.
+        """
+        query = Query()\
+            .match(None, 'a')\
+            .match(None, 'a')\
+            .result(no_exec=True)
+        expected = (
+            'MATCH (a)\n'
+            'RETURN a'
+        )
+        self.assertEqual(query, expected)
+
+        query = Query(deduplicate_chains=False)\
+            .match(None, 'a')\
+            .match(None, 'a')\
+            .result(no_exec=True)
+        expected = (
+            'MATCH (a)\n'
+            'MATCH (a)\n'
+            'RETURN a'
+        )
+        self.assertEqual(query, expected)
+
+        query = Query().match(None, 'a').match(None, 'a')
+        query.result(no_exec=True)
+        query.deduplicate_chains = False
+        self.assertEqual(query.result(no_exec=True), expected)
 #
 #
 # # class MegaTests(TestCase):
@@ -40,8 +40,7 @@ class ValueTests(TestCase):
             """
             types = (SomeObject,)
 
-        with self.assertRaises(TypeError):
-            SomeValue.validate_type('some_value')
+        self.assertRaises(TypeError, SomeValue.validate_type, 'some_value')
         SomeValue.validate_type(SomeObject())
 
     def test_validate_constraints(self):
@@ -56,8 +55,7 @@ class ValueTests(TestCase):
             types = (int,)
             constraints = (lambda x: x < 0,)
 
-        with self.assertRaises(ValueError):
-            SomeValue.validate_constraints(1)
+        self.assertRaises(ValueError, SomeValue.validate_constraints, 1)
         SomeValue.validate_constraints(-1)
 
     def test_normalize(self):
@@ -82,8 +80,10 @@ class ValueTests(TestCase):
             Example of Value.
             """
 
-        examples = [True, 1, 1., 'str"ing']
-        expected_values = ['true', '1', '1.0', '"str\\"ing"']
+        examples = [True, False, 1, 1., 'str"ing', 'Ж\n', None]
+        expected_values = [
+            'true', 'false', '1', '1.0', '"str\\"ing"', '"Ж\\n"', 'null',
+        ]
         for example, expected in zip(examples, expected_values):
             self.assertEqual(SomeValue.to_cypher_value(example), expected)
 
@@ -119,6 +119,33 @@ class ValueTests(TestCase):
         expected = 'toString(a.job) = "developer"'
         self.assertEqual(actual, expected)
 
+    def test_prop_name(self):
+        """
+        Props are named after the attribute of the matched model type.
+        """
+        class Account(models.Node):
+            """
+            Example of a Node reusing a prop under another name.
+            """
+            position = User.job
+
+        details = {
+            'a': models.ModelDetails(User, 'a'),
+            'b': models.ModelDetails(Account, 'b'),
+        }
+        comparison = User.job == 'developer'
+        self.assertEqual(comparison(details, 'a'), 'a.job = "developer"')
+        self.assertEqual(comparison(details, 'b'), 'b.position = "developer"')
+
+    def test_comparison_literal(self):
+        """
+        Literals are validated as soon as the comparison is built.
+        """
+        with self.assertRaises(TypeError):
+            # pylint: disable=pointless-statement
+            User.job == 1
+            # pylint: enable=pointless-statement
+
     def test_eq(self):
         """
         Test equality to a string value.
@@ -211,9 +238,9 @@ class IntegerTests(TestCase):
         """
         values.Integer.validate(1)
 
-        for cls in (float, str):
-            with self.assertRaises(TypeError):
-                values.Integer.validate(cls(1))
+        for example in (1., '1'):
+            with self.subTest(example=example):
+                self.assertRaises(TypeError, values.Integer.validate, example)
 
     def test_constraints(self):
         """
@@ -263,9 +290,9 @@ class StringTests(TestCase):
         """
         values.String.validate('String value')
 
-        for cls in (int, float, bool):
-            with self.assertRaises(TypeError):
-                values.String.validate(cls('1'))
+        for example in (1, 1., True):
+            with self.subTest(example=example):
+                self.assertRaises(TypeError, values.String.validate, example)
 
     def test_lower(self):
         """
@@ -287,9 +314,9 @@ class DateTests(TestCase):
         values.Date.validate(date(2000, 1, 1))
         values.Date.validate(datetime(2000, 1, 1, 1, 1, 1))
 
-        for cls in (int, float, bool):
-            with self.assertRaises(TypeError):
-                values.String.validate(cls('1'))
+        for example in (1, 1., True):
+            with self.subTest(example=example):
+                self.assertRaises(TypeError, values.Date.validate, example)
 
     def test_normalize(self):
         """
@@ -333,9 +360,9 @@ class DateTimeTests(TestCase):
         values.DateTime.validate(date(2000, 1, 1))
         values.DateTime.validate(datetime(2000, 1, 1, 1, 1, 1))
 
-        for cls in (int, float, bool):
-            with self.assertRaises(TypeError):
-                values.String.validate(cls('1'))
+        for example in (1, 1., True):
+            with self.subTest(example=example):
+                self.assertRaises(TypeError, values.DateTime.validate, example)
 
     def test_normalize(self):
         """
@@ -4,19 +4,29 @@ Conditions for queries.
 import json
 import functools
 from datetime import date, datetime
+from json.encoder import encode_basestring
 
-from typing import Any, Callable, Mapping, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Mapping, Type, TypeVar, Union
 
 
 T = TypeVar('T')
 SomeValue = TypeVar('SomeValue', bound='Value')
 Comparison = Callable[[Mapping[str, 'ModelDetails'], str], str]
+# Serializers producing the same output as `json.dumps` for the most common
+# exact types. Anything else is passed to `json.dumps`.
+LITERALS: Dict[type, Callable[[Any], str]] = {
+    bool: lambda value: 'true' if value else 'false',
+    int: int.__repr__,
+    str: encode_basestring,
+}
 
 
 class Value:
     """
     Represent arbitrary type of value.
     """
+    __slots__ = ['expr', 'prop', 'wrappers']
+
     types = (object,)
     constraints = ()
 
@@ -39,14 +49,14 @@ class Value:
         :raise: TypeError
         :param value: value to check against `types`
         """
-        if not any(isinstance(value, t) for t in cls.types):
+        if not isinstance(value, cls.types):
             error_text = (
                 'Trying to assign a value of type `{}` to a `{}` property.'
                 ' Valid types are: {}.'
             ).format(
                 value.__class__.__name__,
                 cls.__name__,
-                ', '.join(map(lambda t: t.__name__, cls.types))
+                ', '.join([t.__name__ for t in cls.types]),
             )
             raise TypeError(error_text)
 
@@ -58,9 +68,10 @@ class Value:
         :raise: ValueError
         :param value: value to check against `constraints`
         """
-        if not all(constraint(value) for constraint in cls.constraints):
-            error = 'Value `%s` does not meet the constraints.' % str(value)
-            raise ValueError(error)
+        for constraint in cls.constraints:
+            if not constraint(value):
+                error = 'Value `%s` does not meet the constraints.' % (value,)
+                raise ValueError(error)
 
     @classmethod
     def validate(cls, value: Any):
@@ -70,7 +81,8 @@ class Value:
         :param value: value to assign to property
         """
         cls.validate_type(value)
-        cls.validate_constraints(value)
+        if cls.constraints:
+            cls.validate_constraints(value)
 
     @staticmethod
     def normalize(value: T) -> T:
@@ -90,7 +102,11 @@ class Value:
         :param value: value to transform
         :return: transformed value
         """
-        return json.dumps(value, ensure_ascii=False)
+        serializer = LITERALS.get(type(value))
+        if serializer is None:
+            return json.dumps(value, ensure_ascii=False)
+
+        return serializer(value)
 
     @staticmethod
     def to_python_value(value: T) -> T:
@@ -111,6 +127,22 @@ class Value:
         :param operator: cypher operator to apply
         :return:
         """
+        # pylint: disable=cyclic-import
+        from .props import BaseProp
+        # pylint: enable=cyclic-import
+
+        if isinstance(other, BaseProp):
+            other = other.value_type(prop=other)
+
+        if isinstance(other, Value):
+            literal = None
+        else:
+            # A literal does not depend on the variables, so it is validated
+            # and transformed once, when the comparison is built.
+            other = self.normalize(other)
+            self.validate(other)
+            literal = self.to_cypher_value(other)
+
         def comparison(
                 details: Mapping[str, 'ModelDetails'],
                 current_var: str,
@@ -128,45 +160,19 @@ class Value:
                     value.prop = getattr(current_details.type, prop_name)
                 else:
                     current_details = details[current_var]
-                    prop_name = next(
-                        name
-                        for name in dir(current_details.type)
-                        if getattr(current_details.type, name) is value.prop
+                    prop_name = current_details.type.get_prop_name(
+                        value.prop,
                     )
 
                 return functools.reduce(
                     lambda result, wrapper: wrapper(result),
                     value.wrappers,
-                    '.'.join((current_var, prop_name)),
+                    f'{current_var}.{prop_name}',
                 )
 
-            def cypherify_other(value: Any) -> str:
-                """
-                Transform python object into string.
-
-                :param value: value to compare with
-                :return: cypherified value
-                """
-                # pylint: disable=cyclic-import
-                from .props import BaseProp
-                # pylint: enable=cyclic-import
-
-                if isinstance(value, BaseProp):
-                    other_value = value.value_type(prop=value)
-                    return as_query_value(other_value)
-                elif isinstance(value, Value):
-                    return as_query_value(value)
+            right = as_query_value(other) if literal is None else literal
 
-                value = self.normalize(value)
-                self.validate(value)
-
-                return self.to_cypher_value(value)
-
-            return ' '.join((
-                as_query_value(self),
-                operator,
-                cypherify_other(other),
-            ))
+            return f'{as_query_value(self)} {operator} {right}'
 
         return comparison
 
@@ -189,7 +195,7 @@ class Value:
             """
             Wrap the value in `toBoolean` function.
             """
-            return 'toBoolean(%s)' % value
+            return f'toBoolean({value})'
 
         converted: Boolean = self._convert_value(Boolean)
         converted.wrappers.append(wrapper)
@@ -204,7 +210,7 @@ class Value:
             """
             Wrap the value in `toBoolean` function.
             """
-            return 'toString(%s)' % value
+            return f'toString({value})'
 
         converted: String = self._convert_value(String)
         converted.wrappers.append(wrapper)
@@ -222,6 +228,8 @@ class Boolean(Value):
     """
     Represent boolean value.
     """
+    __slots__ = []
+
     types = (object,)
 
     @staticmethod
@@ -239,10 +247,11 @@ class Integer(Value):
     """
     Represent integer value.
     """
+    __slots__ = []
+
     types = (int,)
     constraints = (
-        lambda x: x < 9223372036854775808,
-        lambda x: x >= -9223372036854775808,
+        lambda x: -9223372036854775808 <= x < 9223372036854775808,
     )
 
 
@@ -250,6 +259,8 @@ class Float(Value):
     """
     Represent float value.
     """
+    __slots__ = []
+
     types = (float, int)
 
     @staticmethod
@@ -267,6 +278,8 @@ class String(Value):
     """
     Represent string value.
     """
+    __slots__ = []
+
     types = (str,)
 
     def lower(self) -> 'String':
@@ -277,7 +290,7 @@ class String(Value):
             """
             Wrap a string value with `toLower`.
             """
-            return 'toLower(%s)' % value
+            return f'toLower({value})'
 
         self.wrappers.append(wrapper)
 
@@ -290,6 +303,8 @@ class Date(Value):
     so converted to integer when saved to DB. In Python datetime.date is
     used.
     """
+    __slots__ = []
+
     types = (date, datetime)
 
     @staticmethod
@@ -332,6 +347,8 @@ class DateTime(Value):
     Neo4j, so converted to timestamp when saved to DB. In Python
     datetime.datetime is used.
     """
+    __slots__ = []
+
     types = (date, datetime)
 
     @staticmethod
@@ -343,7 +360,7 @@ class DateTime(Value):
         :return: transformed value
         """
         if isinstance(value, date) and not isinstance(value, datetime):
-            return datetime(*value.timetuple()[:3])
+            return datetime(value.year, value.month, value.day)
 
         return value
 